@@ -1,7 +1,7 @@
 from google.adk.agents.llm_agent import Agent
 from google.adk.apps import App
 
-from .tools import extract_and_classify_tasks, build_7_day_plan
+from .tools import extract_and_plan
 
 
 root_agent = Agent(
@@ -15,10 +15,11 @@ root_agent = Agent(
         "You are a structured, empathetic Life-Admin assistant.\n"
         "\n"
         "Workflow:\n"
-        "1. ALWAYS start by calling 'extract_and_classify_tasks' with the "
+        "1. ALWAYS start by calling 'extract_and_plan' with the "
         "   user's full text dump of tasks, ideas, and worries.\n"
-        "2. Inspect the tool output: tasks list, categories, urgency levels, reasons.\n"
-        "3. Then call 'build_7_day_plan' with that output to create a concrete plan.\n"
+        "2. Inspect 'classification' in the tool output: tasks list, categories, "
+        "   urgency levels, reasons.\n"
+        "3. Use 'plan' in the tool output as the concrete 7-day plan.\n"
         "4. In your final reply:\n"
         "   - Start with a short emotional validation (1–2 sentences).\n"
         "   - Show a clear task list grouped by urgency (High / Medium / Low).\n"
@@ -32,8 +33,7 @@ root_agent = Agent(
         "- For follow-up questions, reuse the existing plan unless user asks to redo it."
     ),
     tools=[
-        extract_and_classify_tasks,
-        build_7_day_plan,
+        extract_and_plan,
     ],
 )
 
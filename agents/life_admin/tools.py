@@ -1,35 +1,25 @@
 import datetime
 import re
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Optional, Literal
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Pattern, Tuple
 
 
-@dataclass
-class Task:
-    id: int
-    raw: str
-    clean: str
-    category: str
-    urgency: Literal["high", "medium", "low"]
-    reason: str
-    detected_due_phrase: Optional[str] = None
+# Text splitting
 
+# Bullets, sentence/line breaks and " and " all separate tasks; one pass.
+_SPLIT_RE = re.compile(r"[\n;.•·]|\s+and\s+")
 
-# Text splitting
-def _split_into_candidates(text: str) -> List[str]:
+
+def _iter_candidates(text: str) -> Iterator[str]:
     """
-    Split a messy life-admin dump into candidate task sentences.
+    Yield candidate task sentences from a messy life-admin dump.
     Deterministic, no LLM.
     """
-    tmp = text.replace("•", "\n").replace("·", "\n")
-    tmp = tmp.replace(" and ", ". ")
-    raw_parts = re.split(r"[\n;\.]", tmp)
-    candidates = []
-    for part in raw_parts:
+    for part in _SPLIT_RE.split(text):
         c = part.strip("-• \t").strip()
         if len(c) >= 3:
-            candidates.append(c)
-    return candidates
+            yield c
 
 
 # Category & due detection
@@ -74,29 +64,37 @@ DUE_KEYWORDS = {
 }
 
 
-def _guess_category(text: str) -> str:
-    t = text.lower()
-    for cat, kws in CATEGORY_KEYWORDS.items():
-        for kw in kws:
-            if kw in t:
-                return cat
+# One alternation per category, checked in CATEGORY_KEYWORDS order so the
+# first category with any keyword hit still wins.
+_CATEGORY_RES: List[Tuple[str, Pattern[str]]] = [
+    (cat, re.compile("|".join(map(re.escape, kws))))
+    for cat, kws in CATEGORY_KEYWORDS.items()
+]
+
+_DATE_RE = re.compile(r"\b\d{4}-\d{2}-\d{2}\b|\b\d{1,2}[./-]\d{1,2}\b")
+
+_ADMIN_WORDS = ("visa", "insurance", "tax", "rent", "miete")
+
+
+# The helpers below expect text that is already lowercased.
+
+def _guess_category(t: str) -> str:
+    for cat, pattern in _CATEGORY_RES:
+        if pattern.search(t):
+            return cat
     return "other"
 
 
-def _detect_due_phrase(text: str) -> Optional[str]:
-    t = text.lower()
+def _detect_due_phrase(t: str) -> Optional[str]:
     for phrase in DUE_KEYWORDS.keys():
         if phrase in t:
             return phrase
-    if re.search(r"\b\d{1,2}[./-]\d{1,2}\b", t):
-        return "specific date mentioned"
-    if re.search(r"\b\d{4}-\d{2}-\d{2}\b", t):
+    if _DATE_RE.search(t):
         return "specific date mentioned"
     return None
 
 
-def _guess_urgency(due_phrase: Optional[str], text: str) -> (str, str):
-    t = text.lower()
+def _guess_urgency(due_phrase: Optional[str], t: str) -> Tuple[str, str]:
     if "urgent" in t or "asap" in t:
         return "high", "Marked as urgent/ASAP by you."
 
@@ -106,12 +104,45 @@ def _guess_urgency(due_phrase: Optional[str], text: str) -> (str, str):
     if due_phrase in ("next week", "next weekend", "specific date mentioned"):
         return "medium", f"Upcoming due phrase: '{due_phrase}'."
 
-    if any(w in t for w in ["visa", "insurance", "tax", "rent", "miete"]):
+    if any(w in t for w in _ADMIN_WORDS):
         return "medium", "Administrative/financial task with potential deadlines."
 
     return "low", "No clear due phrase or deadline indicators found."
 
 
+class _Classification(NamedTuple):
+    category: str
+    due_phrase: Optional[str]
+    urgency: str
+    reason: str
+
+
+# Recurring items ("pay rent", "call mom") are classified only once.
+@lru_cache(maxsize=4096)
+def _classify_one(t: str) -> _Classification:
+    """Classify one lowercased candidate."""
+    due_phrase = _detect_due_phrase(t)
+    urgency, reason = _guess_urgency(due_phrase, t)
+    return _Classification(_guess_category(t), due_phrase, urgency, reason)
+
+
+def _cap_first(s: str) -> str:
+    # Unlike str.capitalize, leaves the rest of the text untouched.
+    return s[:1].upper() + s[1:]
+
+
+def _build_task(task_id: int, c: str, classification: _Classification) -> Dict[str, Any]:
+    return {
+        "id": task_id,
+        "raw": c,
+        "clean": _cap_first(c),
+        "category": classification.category,
+        "urgency": classification.urgency,
+        "reason": classification.reason,
+        "detected_due_phrase": classification.due_phrase,
+    }
+
+
 # Tool 1: extract & classify
 
 def extract_and_classify_tasks(raw_text: str) -> Dict[str, Any]:
@@ -122,37 +153,74 @@ def extract_and_classify_tasks(raw_text: str) -> Dict[str, Any]:
     - Guess simple urgency (high/medium/low)
     Returns a JSON-serializable dict of tasks.
     """
-    candidates = _split_into_candidates(raw_text)
-    tasks: List[Task] = []
-
-    for i, c in enumerate(candidates, start=1):
-        due_phrase = _detect_due_phrase(c)
-        urgency, reason = _guess_urgency(due_phrase, c)
-        clean = c[0].upper() + c[1:] if c else c
-        category = _guess_category(c)
-        tasks.append(
-            Task(
-                id=i,
-                raw=c,
-                clean=clean,
-                category=category,
-                urgency=urgency,  # type: ignore[arg-type]
-                reason=reason,
-                detected_due_phrase=due_phrase,
-            )
-        )
+    # Duplicate lines ("pay rent" / "Pay rent") share one key, so the
+    # lru_cache on _classify_one classifies them only once.
+    tasks = [
+        _build_task(i, c, _classify_one(c.lower()))
+        for i, c in enumerate(_iter_candidates(raw_text), start=1)
+    ]
+    urgency_counts = Counter(t["urgency"] for t in tasks)
 
     return {
-        "tasks": [asdict(t) for t in tasks],
+        "tasks": tasks,
         "summary": {
             "total_tasks": len(tasks),
-            "high_urgency": sum(1 for t in tasks if t.urgency == "high"),
-            "medium_urgency": sum(1 for t in tasks if t.urgency == "medium"),
-            "low_urgency": sum(1 for t in tasks if t.urgency == "low"),
+            "high_urgency": urgency_counts["high"],
+            "medium_urgency": urgency_counts["medium"],
+            "low_urgency": urgency_counts["low"],
         },
     }
 
 
+def _assign_days(ranks: List[int], n_days: int, max_per_day: int) -> List[int]:
+    """
+    Pick a day index for each task, given urgency ranks (0 = high,
+    1 = medium, 2 = low) in scheduling order. Works on per-day counts only.
+    """
+    counts = [0] * n_days
+    assigned: List[int] = []
+
+    for rank in ranks:
+        # Define which days are preferred for each urgency level.
+        if rank == 0:
+            # High: spread over first 4 days, but not only today
+            start, stop = 0, min(4, n_days)
+        elif rank == 1:
+            # Medium: focus on days 2–6 (avoid stuffing today)
+            start, stop = 1, n_days
+        else:
+            # Low: prefer later days in the week
+            start, stop = 2, n_days
+
+        # Among candidates, pick the day with the fewest tasks so far
+        # but also respect max_per_day.
+        best_idx = -1
+        for i in range(start, stop):
+            if counts[i] < max_per_day and (best_idx < 0 or counts[i] < counts[best_idx]):
+                best_idx = i
+
+        if best_idx < 0:
+            # if all candidate days are full, choose globally least loaded day
+            best_idx = counts.index(min(counts))
+
+        counts[best_idx] += 1
+        assigned.append(best_idx)
+
+    return assigned
+
+
+@lru_cache(maxsize=8)
+def _day_skeleton(today: datetime.date) -> Tuple[Tuple[str, str], ...]:
+    """(ISO date, label) of the 7 planned days."""
+    skeleton = []
+    base = today.toordinal()
+    for offset in range(7):
+        d = datetime.date.fromordinal(base + offset)
+        label = "Today" if offset == 0 else ("Tomorrow" if offset == 1 else d.strftime("%A"))
+        skeleton.append((d.isoformat(), label))
+    return tuple(skeleton)
+
+
 def build_7_day_plan(task_payload: Dict[str, Any]) -> Dict[str, Any]:
     """
     Deterministic tool:
@@ -164,70 +232,45 @@ def build_7_day_plan(task_payload: Dict[str, Any]) -> Dict[str, Any]:
     today = datetime.date.today()
     tasks_data = task_payload.get("tasks", [])
 
-    # Rebuild Task objects
-    tasks: List[Task] = [
-        Task(
-            id=t["id"],
-            raw=t["raw"],
-            clean=t["clean"],
-            category=t["category"],
-            urgency=t["urgency"],
-            reason=t["reason"],
-            detected_due_phrase=t.get("detected_due_phrase"),
-        )
-        for t in tasks_data
-    ]
-
-    # Sort tasks by urgency (high → medium → low) then id
+    # Sort tasks by urgency (high → medium → low) then id. Each urgency is
+    # mapped to its rank once and plain int tuples are sorted; the input
+    # position breaks ties, so equal keys keep their original order.
     urgency_order = {"high": 0, "medium": 1, "low": 2}
-    tasks_sorted = sorted(
-        tasks,
-        key=lambda t: (
-            urgency_order.get(t.urgency, 2),
-            t.id,
-        ),
+    order = sorted(
+        (urgency_order.get(t["urgency"], 2), t["id"], pos)
+        for pos, t in enumerate(tasks_data)
     )
+    ranks = [rank for rank, _, _ in order]
+    tasks_sorted = [tasks_data[pos] for _, _, pos in order]
 
     # Prepare 7 days
-    days: List[Dict[str, Any]] = []
-    for offset in range(7):
-        d = today + datetime.timedelta(days=offset)
-        label = "Today" if offset == 0 else ("Tomorrow" if offset == 1 else d.strftime("%A"))
-        days.append({"date": d.isoformat(), "label": label, "tasks": []})
+    days: List[Dict[str, Any]] = [
+        {"date": iso, "label": label, "tasks": []} for iso, label in _day_skeleton(today)
+    ]
 
     max_tasks_per_day = 3  # keep any single day from being overloaded
 
-    def candidate_indices_for(task: Task) -> List[int]:
-        """Define which days are preferred for each urgency level."""
-        if task.urgency == "high":
-            # High: spread over first 4 days, but not only today
-            return list(range(0, min(4, len(days))))
-        elif task.urgency == "medium":
-            # Medium: focus on days 2–6 (avoid stuffing today)
-            return list(range(1, len(days)))
-        else:
-            # Low: prefer later days in the week
-            return list(range(2, len(days)))
+    for t, best_idx in zip(tasks_sorted, _assign_days(ranks, len(days), max_tasks_per_day)):
+        days[best_idx]["tasks"].append(t)
 
-    for t in tasks_sorted:
-        candidates = candidate_indices_for(t)
-
-        # Among candidates, pick the day with the fewest tasks so far
-        # but also respect max_tasks_per_day.
-        # First, filter by days that are not full
-        not_full = [i for i in candidates if len(days[i]["tasks"]) < max_tasks_per_day]
+    return {
+        "start_date": days[0]["date"],
+        "end_date": days[-1]["date"],
+        "days": days,
+    }
 
-        if not_full:
-            # choose the least loaded of the not-full candidates
-            best_idx = min(not_full, key=lambda i: len(days[i]["tasks"]))
-        else:
-            # if all candidate days are full, choose globally least loaded day
-            best_idx = min(range(len(days)), key=lambda i: len(days[i]["tasks"]))
 
-        days[best_idx]["tasks"].append(asdict(t))
+# Tool 3: extract, classify & plan in one call
 
+def extract_and_plan(raw_text: str) -> Dict[str, Any]:
+    """
+    Deterministic tool:
+    - Runs extract_and_classify_tasks on the raw text
+    - Feeds the result straight into build_7_day_plan
+    Returns both payloads, saving the model a second tool round-trip.
+    """
+    payload = extract_and_classify_tasks(raw_text)
     return {
-        "start_date": today.isoformat(),
-        "end_date": (today + datetime.timedelta(days=6)).isoformat(),
-        "days": days,
+        "classification": payload,
+        "plan": build_7_day_plan(payload),
     }
@@ -1,21 +1,43 @@
 # app.py
 import asyncio
+import concurrent.futures
 import os
+import threading
 from dotenv import load_dotenv
 load_dotenv()
 
 
-from google.adk.runners import InMemoryRunner
-from agents.life_admin.agent import app
+def build_runner():
+    # Importing ADK + the agent is most of the startup cost, so this runs
+    # in a worker thread while the user is still pasting.
+    from google.adk.runners import InMemoryRunner
+    from agents.life_admin.agent import app
+    from agents.life_admin.tools import extract_and_plan
 
-
-async def main():
     runner = InMemoryRunner(app=app)
+    # Fill the day-skeleton cache; empty text leaves the classifier cache clean.
+    extract_and_plan("")
+    return runner
+
+
+def start_runner():
+    # A daemon thread, so Ctrl-C or an early exit never waits on the import.
+    future = concurrent.futures.Future()
+
+    def work():
+        try:
+            future.set_result(build_runner())
+        except Exception as exc:
+            # Surface a broken ADK/agent import right away, not after the paste.
+            print(f"\nERROR: could not start the agent: {exc!r}")
+            print("Press Enter to exit.")
+            future.set_exception(exc)
+
+    threading.Thread(target=work, daemon=True).start()
+    return future
 
-    print("Life-Admin Agent")
-    print("----------------")
-    print("Paste your messy life-admin tasks (empty line to finish):\n")
 
+def read_lines():
     lines = []
     while True:
         try:
@@ -25,17 +47,37 @@ async def main():
         if not line.strip():
             break
         lines.append(line)
+    return lines
+
+
+def main():
+    runner_future = start_runner()
+
+    print("Life-Admin Agent")
+    print("----------------")
+    print("Paste your messy life-admin tasks (empty line to finish):\n")
+
+    lines = read_lines()
+
+    if runner_future.done() and runner_future.exception() is not None:
+        # Already reported by start_runner.
+        raise SystemExit(1)
 
     user_text = "\n".join(lines)
     if not user_text.strip():
         print("No input provided, exiting.")
         return
 
-    result = await runner.run_debug(user_text)
+    try:
+        runner = runner_future.result()
+    except Exception:
+        # Already reported by start_runner.
+        raise SystemExit(1)
+    result = asyncio.run(runner.run_debug(user_text))
 
 
 if __name__ == "__main__":
     # Make sure GOOGLE_API_KEY is set
     if "GOOGLE_API_KEY" not in os.environ:
         print("WARNING: GOOGLE_API_KEY is not set. Set it or use a .env loader.")
-    asyncio.run(main())
+    main()